@@ -5,12 +5,21 @@ Loads Excel files, handles multiple sheets, and validates schemas.
 
 import pandas as pd
 import os
+from itertools import islice
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 import openpyxl
 from pyxlsb import open_workbook as open_xlsb
 import yaml
 
+# Rust-backed calamine reader (pandas >= 2.2); default engines are used otherwise
+try:
+    import python_calamine  # noqa: F401
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
 
 class DataLoader:
     """Loads and validates Excel files."""
@@ -59,20 +68,22 @@ class DataLoader:
     
     def _load_xlsx(self, excel_path: str, sheet_name: Optional[str] = None,
                    header_row: int = 0) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
-        """Load .xlsx file."""
+        """Load .xlsx/.xls file."""
         if sheet_name:
-            df = pd.read_excel(excel_path, sheet_name=sheet_name, header=header_row)
+            df = pd.read_excel(excel_path, sheet_name=sheet_name, header=header_row,
+                               engine=EXCEL_ENGINE)
             return df
         else:
-            excel_file = pd.ExcelFile(excel_path)
-            sheets = {}
-            for sheet in excel_file.sheet_names:
-                try:
-                    df = pd.read_excel(excel_path, sheet_name=sheet, header=header_row)
-                    sheets[sheet] = df
-                except Exception as e:
-                    print(f"Warning: Could not load sheet '{sheet}': {e}")
-            return sheets
+            # Open the workbook once and parse each sheet from it
+            with pd.ExcelFile(excel_path, engine=EXCEL_ENGINE) as excel_file:
+                sheets = {}
+                for sheet in excel_file.sheet_names:
+                    try:
+                        df = excel_file.parse(sheet, header=header_row)
+                        sheets[sheet] = df
+                    except Exception as e:
+                        print(f"Warning: Could not load sheet '{sheet}': {e}")
+                return sheets
     
     def _load_xlsb(self, excel_path: str, sheet_name: Optional[str] = None,
                    header_row: int = 0) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
@@ -90,10 +101,14 @@ class DataLoader:
                         print(f"Warning: Could not load sheet '{sheet}': {e}")
                 return sheets
     
-    def _read_xlsb_sheet(self, wb, sheet_name: str, header_row: int = 0) -> pd.DataFrame:
-        """Read a single sheet from xlsb workbook."""
+    def _read_xlsb_sheet(self, wb, sheet_name: str, header_row: int = 0,
+                         nrows: Optional[int] = None) -> pd.DataFrame:
+        """Read a single sheet (or its first nrows data rows) from xlsb workbook."""
+        sheet_rows = wb.get_sheet(sheet_name)
+        if nrows is not None:
+            sheet_rows = islice(sheet_rows, header_row + 1 + nrows)
         rows = []
-        for row in wb.get_sheet(sheet_name):
+        for row in sheet_rows:
             rows.append([cell.v if hasattr(cell, 'v') else None for cell in row])
         
         if not rows:
@@ -110,6 +125,80 @@ class DataLoader:
         df = pd.DataFrame(data_rows, columns=columns)
         return df
     
+    def get_sheet_info(self, excel_path: str, header_row: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get sheet names and data row counts without loading cell data.
+        
+        Row counts of .xlsx sheets are taken from the streamed rows up to the
+        last non-empty one, matching load_excel even when the stored sheet
+        dimensions are stale; .xlsb counts come from the stored dimensions.
+        
+        Args:
+            excel_path: Path to the Excel file
+            header_row: Row number used as header (0-indexed)
+        
+        Returns:
+            List of {'name', 'row_count'} dicts in workbook order
+        """
+        if not os.path.exists(excel_path):
+            raise FileNotFoundError(f"Excel file not found: {excel_path}")
+        
+        file_extension = os.path.splitext(excel_path)[1].lower()
+        sheets = []
+        
+        if file_extension == '.xlsb':
+            with open_xlsb(excel_path) as wb:
+                for sheet in wb.sheets:
+                    with wb.get_sheet(sheet) as ws:
+                        dim = ws.dimension
+                        total_rows = dim.r + dim.h if dim else 0
+                    sheets.append({'name': sheet, 'row_count': max(total_rows - header_row - 1, 0)})
+        elif file_extension == '.xlsx':
+            wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+            try:
+                for ws in wb.worksheets:
+                    # The stored <dimension> may be stale or cover formatted empty
+                    # rows; stream the rows and stop at the last non-empty one
+                    ws.reset_dimensions()
+                    total_rows = 0
+                    for row_number, row in enumerate(ws.iter_rows(values_only=True), 1):
+                        if any(value is not None for value in row):
+                            total_rows = row_number
+                    sheets.append({'name': ws.title, 'row_count': max(total_rows - header_row - 1, 0)})
+            finally:
+                wb.close()
+        else:
+            # Legacy formats have no read-only reader; fall back to a full load
+            for sheet, df in self.load_excel(excel_path, header_row=header_row).items():
+                sheets.append({'name': sheet, 'row_count': len(df)})
+        
+        return sheets
+    
+    def load_sheet_sample(self, excel_path: str, sheet_name: str, nrows: int = 100,
+                          header_row: int = 0) -> pd.DataFrame:
+        """
+        Load the header and first rows of a sheet.
+        
+        Column names match load_excel; dtypes are inferred from the sampled rows.
+        
+        Args:
+            excel_path: Path to the Excel file
+            sheet_name: Sheet to read
+            nrows: Number of data rows to read
+            header_row: Row number to use as header (0-indexed)
+        
+        Returns:
+            DataFrame with at most nrows rows
+        """
+        if not os.path.exists(excel_path):
+            raise FileNotFoundError(f"Excel file not found: {excel_path}")
+        
+        if os.path.splitext(excel_path)[1].lower() == '.xlsb':
+            with open_xlsb(excel_path) as wb:
+                return self._read_xlsb_sheet(wb, sheet_name, header_row, nrows=nrows)
+        return pd.read_excel(excel_path, sheet_name=sheet_name, header=header_row, nrows=nrows,
+                             engine=EXCEL_ENGINE)
+    
     def validate_schema(self, df: pd.DataFrame, schema_name: str) -> Dict[str, Any]:
         """
         Validate a DataFrame against a schema definition.
@@ -8,7 +8,7 @@ from pptx import Presentation
 from pptx.util import Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 import yaml
 import pandas as pd
 try:
@@ -31,7 +31,7 @@ class PPTGenerator:
         return str(text).strip()
     
     def __init__(self, template_path: Optional[str] = None,
-                 slides_config: Optional[str] = None,
+                 slides_config: Optional[Union[str, Dict[str, Any]]] = None,
                  formatting_config: Optional[str] = None,
                  affiliate: Optional[str] = None):
         """
@@ -39,7 +39,8 @@ class PPTGenerator:
         
         Args:
             template_path: Path to PowerPoint template file
-            slides_config: Path to slides configuration YAML file
+            slides_config: Path to slides configuration YAML file, or an
+                already-parsed configuration dict with a 'slides' list
             formatting_config: Path to formatting configuration YAML file
             affiliate: Selected affiliate (AIL, APC, ASC) for replacing in title slide
         """
@@ -58,7 +59,9 @@ class PPTGenerator:
         self.slides_mapping = {}
         self.formatting_rules = {}
         
-        if slides_config and os.path.exists(slides_config):
+        if isinstance(slides_config, dict):
+            self._set_slides_config(slides_config)
+        elif slides_config and os.path.exists(slides_config):
             self._load_slides_config()
         
         if formatting_config and os.path.exists(formatting_config):
@@ -72,10 +75,14 @@ class PPTGenerator:
         """Load slides configuration from YAML file."""
         with open(self.slides_config, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f)
-            self.slides_mapping = config.get("slides", [])
-            print(f"DEBUG: Loaded {len(self.slides_mapping)} slide configurations")
-            for idx, slide_config in enumerate(self.slides_mapping, start=1):
-                print(f"DEBUG: Slide {idx}: type={slide_config.get('slide_type')}, title='{slide_config.get('title')}', chart_enabled={slide_config.get('chart', {}).get('enabled', False)}")
+        self._set_slides_config(config)
+    
+    def _set_slides_config(self, config: Dict[str, Any]):
+        """Use a parsed slides configuration."""
+        self.slides_mapping = config.get("slides", [])
+        print(f"DEBUG: Loaded {len(self.slides_mapping)} slide configurations")
+        for idx, slide_config in enumerate(self.slides_mapping, start=1):
+            print(f"DEBUG: Slide {idx}: type={slide_config.get('slide_type')}, title='{slide_config.get('title')}', chart_enabled={slide_config.get('chart', {}).get('enabled', False)}")
     
     def _load_formatting_config(self):
         """Load formatting configuration from YAML file."""
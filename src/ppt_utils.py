@@ -0,0 +1,102 @@
+"""
+PPT Utilities
+Shared helpers for reading slide content straight from the underlying XML.
+"""
+
+from typing import List, Optional
+from lxml import etree
+from pptx.oxml.ns import qn
+
+
+_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
+}
+
+# Compiled once at import time
+_TOP_LEVEL_TABLES_XPATH = etree.XPath(
+    './p:cSld/p:spTree/p:graphicFrame/a:graphic/a:graphicData/a:tbl', namespaces=_NAMESPACES
+)
+
+A_TR = qn('a:tr')
+A_TC = qn('a:tc')
+A_P = qn('a:p')
+A_R = qn('a:r')
+A_BR = qn('a:br')
+A_FLD = qn('a:fld')
+A_T = qn('a:t')
+A_TXBODY = qn('a:txBody')
+
+
+def _paragraph_text(p) -> str:
+    """
+    Read the text of a single ``<a:p>`` element.
+    
+    Runs and fields contribute the text of their ``<a:t>`` child and each
+    ``<a:br>`` line break contributes a vertical tab, in document order,
+    matching python-pptx's ``_Paragraph.text``.
+    
+    Args:
+        p: ``<a:p>`` lxml element
+    
+    Returns:
+        Paragraph text
+    """
+    return "".join(
+        "\v" if child.tag == A_BR else (child.findtext(A_T) or "")
+        for child in p.iterchildren(A_R, A_BR, A_FLD)
+    )
+
+
+def text_body_text(txBody) -> str:
+    """
+    Read the text of a text body (``<p:txBody>`` or a table cell's ``<a:txBody>``).
+    
+    Matches ``text_frame.text`` (and ``cell.text``), including ``\\v`` for
+    line breaks, without building paragraph and run wrappers.
+    
+    Args:
+        txBody: Text body lxml element (e.g. ``text_frame._txBody``)
+    
+    Returns:
+        Text of all paragraphs joined with newlines
+    """
+    return "\n".join(_paragraph_text(p) for p in txBody.iterchildren(A_P))
+
+
+def table_cell_texts(tbl) -> List[List[str]]:
+    """
+    Read the text of every cell of a table.
+    
+    Args:
+        tbl: ``<a:tbl>`` lxml element (e.g. ``table._tbl``)
+    
+    Returns:
+        Rows x columns list of cell texts (paragraphs joined with newlines)
+    """
+    return [
+        [
+            "".join(text_body_text(txBody) for txBody in tc.iterchildren(A_TXBODY))
+            for tc in tr.iterchildren(A_TC)
+        ]
+        for tr in tbl.iterchildren(A_TR)
+    ]
+
+
+def extract_first_table(slide) -> Optional[List[List[str]]]:
+    """
+    Extract the cell texts of the first table on a slide.
+    
+    Only top-level table shapes are considered, in the same order as
+    ``slide.shapes``, without building python-pptx shape wrappers.
+    
+    Args:
+        slide: PowerPoint slide object
+    
+    Returns:
+        Rows x columns list of cell texts, or None if the slide has no table
+    """
+    tables = _TOP_LEVEL_TABLES_XPATH(slide._element)
+    if not tables:
+        return None
+    return table_cell_texts(tables[0])
@@ -7,11 +7,18 @@ from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.enum.text import MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
+from pptx.oxml.ns import qn
+from lxml import etree
 import json
 import os
 from typing import Dict, List, Any, Optional, Tuple
 
 
+# Paragraph content elements removed when clearing text (same set python-pptx
+# drops for ``paragraph.text = ""``); paragraph properties are kept
+_TEXT_CONTENT_TAGS = (qn('a:r'), qn('a:br'), qn('a:fld'))
+
+
 def extract_rgb_from_color(rgb_color) -> Optional[Dict[str, int]]:
     """
     Safely extract RGB values from an RGBColor object.
@@ -262,9 +269,10 @@ class TemplateExtractor:
             # Copy shape structure but clear text content
             for shape in slide.shapes:
                 if shape.has_text_frame:
-                    # Keep structure but clear text
-                    for paragraph in shape.text_frame.paragraphs:
-                        paragraph.text = ""
+                    # Keep structure but clear text: strip all runs, breaks and
+                    # fields from the text body in a single lxml pass
+                    etree.strip_elements(shape.text_frame._txBody, *_TEXT_CONTENT_TAGS,
+                                         with_tail=False)
         
         template_prs.save(output_path)
 
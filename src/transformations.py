@@ -8,6 +8,37 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 
+# Lazily compiled numba kernel for calculate_percentage_change
+# (None = not tried yet, False = numba unavailable)
+_pct_change_kernel = None
+
+
+def _get_pct_change_kernel():
+    """
+    Compile (once) the fused percentage-change kernel.
+    
+    Returns:
+        The numba-compiled kernel, or None if numba is not installed
+    """
+    global _pct_change_kernel
+    
+    if _pct_change_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _pct_change_kernel = False
+        else:
+            # error_model='numpy' keeps pandas semantics for division by zero (inf/nan)
+            @njit(cache=True, parallel=True, error_model='numpy')
+            def _pct_change(cur, prev, out):
+                for i in prange(cur.size):
+                    value = (cur[i] - prev[i]) / prev[i] * 100.0
+                    out[i] = 0.0 if np.isnan(value) else value
+            
+            _pct_change_kernel = _pct_change
+    
+    return _pct_change_kernel or None
+
 
 class DataTransformations:
     """Collection of reusable data transformation functions."""
@@ -89,7 +120,21 @@ class DataTransformations:
             DataFrame with percentage change column added
         """
         df = df.copy()
-        df[output_col] = ((df[current_col] - df[previous_col]) / df[previous_col] * 100).fillna(0)
+        
+        kernel = None
+        if (pd.api.types.is_numeric_dtype(df[current_col]) and
+                pd.api.types.is_numeric_dtype(df[previous_col])):
+            kernel = _get_pct_change_kernel()
+        
+        if kernel is not None:
+            # Fuse subtract/divide/multiply/fillna into a single pass
+            cur = df[current_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            prev = df[previous_col].to_numpy(dtype=np.float64, na_value=np.nan)
+            out = np.empty_like(cur)
+            kernel(cur, prev, out)
+            df[output_col] = out
+        else:
+            df[output_col] = ((df[current_col] - df[previous_col]) / df[previous_col] * 100).fillna(0)
         return df
     
     @staticmethod
@@ -3,35 +3,142 @@ PPT Validator
 Compares generated PPTs with manual versions and creates validation reports.
 """
 
+import hashlib
 import os
+import re
 import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pptx import Presentation
+from lxml import etree
 from typing import Dict, List, Any, Optional, Tuple
 import json
 from datetime import datetime
 
-# Handle imports for both module and script usage
 try:
-    from template_extractor import TemplateExtractor
+    from .ppt_utils import table_cell_texts, text_body_text
 except ImportError:
-    try:
-        from src.template_extractor import TemplateExtractor
-    except ImportError:
-        # If running as script, add src to path
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        from src.template_extractor import TemplateExtractor
+    from ppt_utils import table_cell_texts, text_body_text
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=8192)
+def _normalize(text: str) -> str:
+    """
+    Collapse whitespace (including newlines) and lowercase.
+    
+    Results are cached and interned, so equal normalized texts are the same object.
+    """
+    return sys.intern(_WHITESPACE_RE.sub(' ', text).strip().lower())
+
+
+def _xml_digest(element) -> bytes:
+    """Return the SHA-256 digest of an lxml element's serialized XML."""
+    return hashlib.sha256(etree.tostring(element)).digest()
+
+
+# Everything the comparison passes need from a shape, read in one walk:
+# shape type string, text-frame text (None if no text frame), Table (None if not a table)
+ShapeSnapshot = namedtuple("ShapeSnapshot", ["shape_type", "text", "table"])
+
+
+def _snapshot_shape(shape) -> ShapeSnapshot:
+    """Read a shape's type, text and table once."""
+    return ShapeSnapshot(
+        str(shape.shape_type),
+        text_body_text(shape.text_frame._txBody) if shape.has_text_frame else None,
+        shape.table if shape.has_table else None
+    )
+
+
+class TableResult:
+    """Validation result for one table (kept internal to validate_shape)."""
+    
+    __slots__ = ("match", "row_count_match", "column_count_match", "mismatch_indices", "errors")
+    
+    def __init__(self):
+        self.match = True
+        self.row_count_match = False
+        self.column_count_match = False
+        self.mismatch_indices: List[Tuple[int, int]] = []
+        self.errors: List[str] = []
+
+
+class ShapeResult:
+    """Validation result for one shape (internal; results are returned as dicts)."""
+    
+    __slots__ = ("shape_index", "match", "type_match", "text_match", "errors",
+                 "table_match", "table_errors", "table_mismatch_indices")
+    
+    def __init__(self, shape_index: int):
+        self.shape_index = shape_index
+        self.match = True
+        self.type_match = False
+        self.text_match = False
+        self.errors: List[str] = []
+        # Only set when both shapes are tables
+        self.table_match: Optional[bool] = None
+        self.table_errors: Optional[List[str]] = None
+        self.table_mismatch_indices: Optional[List[Tuple[int, int]]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain-dict result form (mismatch indices are expanded by validate_all)."""
+        result = {
+            "shape_index": self.shape_index,
+            "match": self.match,
+            "type_match": self.type_match,
+            "text_match": self.text_match,
+            "errors": self.errors
+        }
+        if self.table_match is not None:
+            result["table_match"] = self.table_match
+            result["table_errors"] = self.table_errors
+        return result
+
+
+class SlideResult:
+    """Validation result for one slide (internal; results are returned as dicts)."""
+    
+    __slots__ = ("slide_number", "match", "shape_count_match", "shapes", "errors")
+    
+    def __init__(self, slide_number: int):
+        self.slide_number = slide_number
+        self.match = True
+        self.shape_count_match = False
+        self.shapes: List[ShapeResult] = []
+        self.errors: List[str] = []
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain-dict result form."""
+        return {
+            "slide_number": self.slide_number,
+            "match": self.match,
+            "shape_count_match": self.shape_count_match,
+            "shapes": [shape_result.to_dict() for shape_result in self.shapes],
+            "errors": self.errors
+        }
 
 
 class PPTValidator:
     """Validates generated PowerPoint decks against manual versions."""
     
-    def __init__(self, manual_ppt_path: str, generated_ppt_path: str):
+    def __init__(self, manual_ppt_path: str, generated_ppt_path: str, fast_fail: bool = False):
         """
         Initialize the validator.
         
         Args:
             manual_ppt_path: Path to manually created PowerPoint file
             generated_ppt_path: Path to generated PowerPoint file
+            fast_fail: Stop validating a slide (or table) as soon as a structural
+                mismatch (shape, row or column count) is found, for pass/fail
+                checks that don't need the full report
         """
         if not os.path.exists(manual_ppt_path):
             raise FileNotFoundError(f"Manual PPT file not found: {manual_ppt_path}")
@@ -40,9 +147,20 @@ class PPTValidator:
         
         self.manual_ppt_path = manual_ppt_path
         self.generated_ppt_path = generated_ppt_path
+        self.fast_fail = fast_fail
+        
+        # Per-slide shape snapshots, built lazily: {("manual" | "generated", slide_index): [...]}
+        self._shape_snapshots: Dict[Tuple[str, int], List[ShapeSnapshot]] = {}
+        # SlideResult records of the last validate_all; validation_results
+        # holds their plain-dict form
+        self._slide_results: List[SlideResult] = []
         
-        self.manual_prs = Presentation(manual_ppt_path)
-        self.generated_prs = Presentation(generated_ppt_path)
+        # Both decks are independent zip + XML parses; overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            manual_future = executor.submit(Presentation, manual_ppt_path)
+            generated_future = executor.submit(Presentation, generated_ppt_path)
+            self.manual_prs = manual_future.result()
+            self.generated_prs = generated_future.result()
         
         self.validation_results = {
             "manual_file": manual_ppt_path,
@@ -58,10 +176,17 @@ class PPTValidator:
             }
         }
     
-    def validate_all(self) -> Dict[str, Any]:
+    def validate_all(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Validate all slides in both presentations.
         
+        Slides are independent, so larger decks are validated in a process pool;
+        each worker parses both presentations once and validates a share of slides.
+        
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count);
+                1 validates sequentially in this process
+        
         Returns:
             Dictionary containing validation results
         """
@@ -74,12 +199,21 @@ class PPTValidator:
         
         # Validate each slide
         max_slides = min(manual_count, generated_count)
-        
-        for slide_idx in range(max_slides):
-            slide_result = self.validate_slide(slide_idx)
-            self.validation_results["slides"].append(slide_result)
-            
-            if slide_result["match"]:
+        workers = min(max_workers or os.cpu_count() or 1, max_slides)
+        
+        if workers > 1 and max_slides >= _PARALLEL_MIN_SLIDES:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_slide_worker,
+                initargs=(self.manual_ppt_path, self.generated_ppt_path, self.fast_fail)
+            ) as executor:
+                slide_results = list(executor.map(_validate_slide_worker, range(max_slides)))
+        else:
+            slide_results = [self.validate_slide(slide_idx) for slide_idx in range(max_slides)]
+        
+        self._slide_results = slide_results
+        for slide_result in slide_results:
+            if slide_result.match:
                 self.validation_results["summary"]["matching_slides"] += 1
             else:
                 self.validation_results["summary"]["mismatches"] += 1
@@ -90,9 +224,10 @@ class PPTValidator:
                 self.validation_results["summary"]["matching_slides"] / max_slides * 100
             )
         
+        self.validation_results["slides"] = self._expand_cell_matches()
         return self.validation_results
     
-    def validate_slide(self, slide_index: int) -> Dict[str, Any]:
+    def validate_slide(self, slide_index: int) -> SlideResult:
         """
         Validate a single slide.
         
@@ -100,48 +235,49 @@ class PPTValidator:
             slide_index: Index of the slide to validate (0-based)
         
         Returns:
-            Dictionary containing slide validation results
+            Slide validation result
         """
         manual_slide = self.manual_prs.slides[slide_index]
         generated_slide = self.generated_prs.slides[slide_index]
         
-        slide_result = {
-            "slide_number": slide_index + 1,
-            "match": True,
-            "shape_count_match": False,
-            "shapes": [],
-            "errors": []
-        }
+        slide_result = SlideResult(slide_index + 1)
+        
+        # Identical slide XML: everything validated below (shape types, text,
+        # tables) lives in that XML, so skip the shape-by-shape walk
+        if _xml_digest(manual_slide._element) == _xml_digest(generated_slide._element):
+            slide_result.shape_count_match = True
+            return slide_result
+        
+        # Each shape tree is walked once and cached (indexing slide.shapes
+        # re-walks it per access)
+        manual_shapes = self._slide_snapshots("manual", slide_index)
+        generated_shapes = self._slide_snapshots("generated", slide_index)
         
         # Check shape count
-        manual_shape_count = len(manual_slide.shapes)
-        generated_shape_count = len(generated_slide.shapes)
-        slide_result["shape_count_match"] = manual_shape_count == generated_shape_count
-        
-        # Validate shapes
-        max_shapes = min(manual_shape_count, generated_shape_count)
-        
-        for shape_idx in range(max_shapes):
-            shape_result = self.validate_shape(
-                manual_slide.shapes[shape_idx],
-                generated_slide.shapes[shape_idx],
-                shape_idx
-            )
-            slide_result["shapes"].append(shape_result)
-            
-            if not shape_result["match"]:
-                slide_result["match"] = False
+        manual_shape_count = len(manual_shapes)
+        generated_shape_count = len(generated_shapes)
+        slide_result.shape_count_match = manual_shape_count == generated_shape_count
         
         # If shape counts don't match, add error
-        if not slide_result["shape_count_match"]:
-            slide_result["errors"].append(
+        if not slide_result.shape_count_match:
+            slide_result.errors.append(
                 f"Shape count mismatch: manual={manual_shape_count}, generated={generated_shape_count}"
             )
-            slide_result["match"] = False
+            slide_result.match = False
+            if self.fast_fail:
+                return slide_result
+        
+        # Validate shapes pairwise, up to the shorter of the two
+        for shape_idx, (manual_shape, generated_shape) in enumerate(zip(manual_shapes, generated_shapes)):
+            shape_result = self._compare_shapes(manual_shape, generated_shape, shape_idx)
+            slide_result.shapes.append(shape_result)
+            
+            if not shape_result.match:
+                slide_result.match = False
         
         return slide_result
     
-    def validate_shape(self, manual_shape, generated_shape, shape_index: int) -> Dict[str, Any]:
+    def validate_shape(self, manual_shape, generated_shape, shape_index: int) -> ShapeResult:
         """
         Validate a single shape.
         
@@ -151,56 +287,78 @@ class PPTValidator:
             shape_index: Index of the shape
         
         Returns:
-            Dictionary containing shape validation results
+            Shape validation result
         """
-        shape_result = {
-            "shape_index": shape_index,
-            "match": True,
-            "type_match": False,
-            "text_match": False,
-            "errors": []
-        }
+        return self._compare_shapes(
+            _snapshot_shape(manual_shape), _snapshot_shape(generated_shape), shape_index
+        )
+    
+    def _slide_snapshots(self, deck: str, slide_index: int) -> List[ShapeSnapshot]:
+        """
+        Get the shape snapshots of a slide, walking its shape tree on first use.
+        
+        Args:
+            deck: "manual" or "generated"
+            slide_index: Index of the slide (0-based)
+        
+        Returns:
+            List of shape snapshots in slide.shapes order
+        """
+        key = (deck, slide_index)
+        snapshots = self._shape_snapshots.get(key)
+        if snapshots is None:
+            prs = self.manual_prs if deck == "manual" else self.generated_prs
+            snapshots = [_snapshot_shape(shape) for shape in prs.slides[slide_index].shapes]
+            self._shape_snapshots[key] = snapshots
+        return snapshots
+    
+    def _compare_shapes(self, manual_shape: ShapeSnapshot, generated_shape: ShapeSnapshot,
+                        shape_index: int) -> ShapeResult:
+        """Validate a pair of shape snapshots (see validate_shape)."""
+        shape_result = ShapeResult(shape_index)
         
         # Check shape type
-        manual_type = str(manual_shape.shape_type)
-        generated_type = str(generated_shape.shape_type)
-        shape_result["type_match"] = manual_type == generated_type
+        manual_type = manual_shape.shape_type
+        generated_type = generated_shape.shape_type
+        shape_result.type_match = manual_type == generated_type
         
-        if not shape_result["type_match"]:
-            shape_result["errors"].append(
+        if not shape_result.type_match:
+            shape_result.errors.append(
                 f"Type mismatch: manual={manual_type}, generated={generated_type}"
             )
-            shape_result["match"] = False
+            shape_result.match = False
         
         # Check text content
-        if manual_shape.has_text_frame and generated_shape.has_text_frame:
-            manual_text = manual_shape.text_frame.text
-            generated_text = generated_shape.text_frame.text
+        if manual_shape.text is not None and generated_shape.text is not None:
+            manual_text = manual_shape.text
+            generated_text = generated_shape.text
             
             # Normalize text for comparison
             manual_text_normalized = self._normalize_text(manual_text)
             generated_text_normalized = self._normalize_text(generated_text)
             
-            shape_result["text_match"] = manual_text_normalized == generated_text_normalized
+            shape_result.text_match = manual_text_normalized == generated_text_normalized
             
-            if not shape_result["text_match"]:
-                shape_result["errors"].append(
+            if not shape_result.text_match:
+                shape_result.errors.append(
                     f"Text mismatch:\n  Manual: {manual_text[:100]}...\n  Generated: {generated_text[:100]}..."
                 )
-                shape_result["match"] = False
+                shape_result.match = False
         
         # Check table content
-        elif manual_shape.has_table and generated_shape.has_table:
+        elif manual_shape.table is not None and generated_shape.table is not None:
             table_result = self.validate_table(manual_shape.table, generated_shape.table)
-            shape_result["table_match"] = table_result["match"]
-            shape_result["table_errors"] = table_result.get("errors", [])
+            shape_result.table_match = table_result.match
+            shape_result.table_errors = table_result.errors
+            if table_result.mismatch_indices:
+                shape_result.table_mismatch_indices = table_result.mismatch_indices
             
-            if not table_result["match"]:
-                shape_result["match"] = False
+            if not table_result.match:
+                shape_result.match = False
         
         return shape_result
     
-    def validate_table(self, manual_table, generated_table) -> Dict[str, Any]:
+    def validate_table(self, manual_table, generated_table) -> TableResult:
         """
         Validate a table.
         
@@ -209,59 +367,57 @@ class PPTValidator:
             generated_table: Generated table object
         
         Returns:
-            Dictionary containing table validation results
+            Table validation result
         """
-        table_result = {
-            "match": True,
-            "row_count_match": False,
-            "column_count_match": False,
-            "cell_matches": [],
-            "errors": []
-        }
+        table_result = TableResult()
         
         manual_rows = len(manual_table.rows)
         generated_rows = len(generated_table.rows)
         manual_cols = len(manual_table.columns)
         generated_cols = len(generated_table.columns)
         
-        table_result["row_count_match"] = manual_rows == generated_rows
-        table_result["column_count_match"] = manual_cols == generated_cols
+        table_result.row_count_match = manual_rows == generated_rows
+        table_result.column_count_match = manual_cols == generated_cols
         
-        if not table_result["row_count_match"]:
-            table_result["errors"].append(
+        if not table_result.row_count_match:
+            table_result.errors.append(
                 f"Row count mismatch: manual={manual_rows}, generated={generated_rows}"
             )
-            table_result["match"] = False
+            table_result.match = False
         
-        if not table_result["column_count_match"]:
-            table_result["errors"].append(
+        if not table_result.column_count_match:
+            table_result.errors.append(
                 f"Column count mismatch: manual={manual_cols}, generated={generated_cols}"
             )
-            table_result["match"] = False
+            table_result.match = False
+        
+        if not table_result.match and self.fast_fail:
+            return table_result
         
         # Validate cell content
         max_rows = min(manual_rows, generated_rows)
         max_cols = min(manual_cols, generated_cols)
         
-        for row_idx in range(max_rows):
-            for col_idx in range(max_cols):
-                manual_cell_text = manual_table.cell(row_idx, col_idx).text
-                generated_cell_text = generated_table.cell(row_idx, col_idx).text
-                
-                manual_normalized = self._normalize_text(manual_cell_text)
-                generated_normalized = self._normalize_text(generated_cell_text)
-                
-                cell_match = manual_normalized == generated_normalized
-                table_result["cell_matches"].append({
-                    "row": row_idx,
-                    "column": col_idx,
-                    "match": cell_match,
-                    "manual": manual_cell_text,
-                    "generated": generated_cell_text
-                })
-                
-                if not cell_match:
-                    table_result["match"] = False
+        manual_cells = table_cell_texts(manual_table._tbl)
+        generated_cells = table_cell_texts(generated_table._tbl)
+        
+        # Normalized texts are interned, so equal cells (the common case) are
+        # usually settled by the identity check before comparing by value.
+        # Just the (row, column) of mismatching cells is kept; their texts are
+        # fetched again by _expand_cell_matches once every slide is validated
+        manual_normalized = [
+            self._normalize_text(manual_cells[row_idx][col_idx])
+            for row_idx in range(max_rows) for col_idx in range(max_cols)
+        ]
+        generated_normalized = [
+            self._normalize_text(generated_cells[row_idx][col_idx])
+            for row_idx in range(max_rows) for col_idx in range(max_cols)
+        ]
+        
+        for flat_idx, (manual_text, generated_text) in enumerate(zip(manual_normalized, generated_normalized)):
+            if not (manual_text is generated_text or manual_text == generated_text):
+                table_result.mismatch_indices.append(divmod(flat_idx, max_cols))
+                table_result.match = False
         
         return table_result
     
@@ -275,13 +431,51 @@ class PPTValidator:
         Returns:
             Normalized text
         """
-        # Remove extra whitespace
-        text = " ".join(text.split())
-        # Convert to lowercase for comparison
-        text = text.lower()
-        # Remove special characters that might differ
-        text = text.replace("\n", " ").replace("\r", " ")
-        return text.strip()
+        return _normalize(text)
+    
+    def _expand_cell_matches(self) -> List[Dict[str, Any]]:
+        """
+        Convert the slide results to plain dicts with per-cell details for
+        mismatched table cells.
+        
+        Validation only keeps the (row, column) of mismatched cells; their
+        manual and generated texts are read back here, once validation is done.
+        
+        Returns:
+            List of slide result dicts with ``cell_matches`` filled in
+        """
+        slides = []
+        for slide_result in self._slide_results:
+            slide_report = slide_result.to_dict()
+            slides.append(slide_report)
+            
+            if not any(shape.table_mismatch_indices for shape in slide_result.shapes):
+                continue
+            
+            slide_index = slide_result.slide_number - 1
+            manual_shapes = self._slide_snapshots("manual", slide_index)
+            generated_shapes = self._slide_snapshots("generated", slide_index)
+            
+            for shape_result, shape_report in zip(slide_result.shapes, slide_report["shapes"]):
+                if not shape_result.table_mismatch_indices:
+                    continue
+                
+                shape_index = shape_result.shape_index
+                manual_cells = table_cell_texts(manual_shapes[shape_index].table._tbl)
+                generated_cells = table_cell_texts(generated_shapes[shape_index].table._tbl)
+                
+                shape_report["cell_matches"] = [
+                    {
+                        "row": row_idx,
+                        "column": col_idx,
+                        "match": False,
+                        "manual": manual_cells[row_idx][col_idx],
+                        "generated": generated_cells[row_idx][col_idx]
+                    }
+                    for row_idx, col_idx in shape_result.table_mismatch_indices
+                ]
+        
+        return slides
     
     def save_report(self, output_path: str):
         """
@@ -290,39 +484,72 @@ class PPTValidator:
         Args:
             output_path: Path to save the report
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.validation_results, f, indent=2, ensure_ascii=False)
+        report = self.validation_results
+        
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
     
     def print_summary(self):
         """Print a summary of validation results."""
         summary = self.validation_results["summary"]
         
-        print("\n" + "="*60)
-        print("VALIDATION SUMMARY")
-        print("="*60)
-        print(f"Total Slides: {summary['total_slides']}")
-        print(f"Matching Slides: {summary['matching_slides']}")
-        print(f"Mismatches: {summary['mismatches']}")
-        print(f"Accuracy: {summary['accuracy']:.2f}%")
-        print("="*60)
-        
-        # Print slide-level errors
+        # Build the whole summary first and write it with a single call
+        lines = [
+            "\n" + "="*60,
+            "VALIDATION SUMMARY",
+            "="*60,
+            f"Total Slides: {summary['total_slides']}",
+            f"Matching Slides: {summary['matching_slides']}",
+            f"Mismatches: {summary['mismatches']}",
+            f"Accuracy: {summary['accuracy']:.2f}%",
+            "="*60
+        ]
+        
+        # Slide-level errors
         for slide_result in self.validation_results["slides"]:
             if not slide_result["match"]:
-                print(f"\nSlide {slide_result['slide_number']} - MISMATCH:")
+                lines.append(f"\nSlide {slide_result['slide_number']} - MISMATCH:")
                 for error in slide_result.get("errors", []):
-                    print(f"  - {error}")
+                    lines.append(f"  - {error}")
                 
-                # Print shape-level errors
+                # Shape-level errors
                 for shape_result in slide_result.get("shapes", []):
                     if not shape_result["match"]:
-                        print(f"  Shape {shape_result['shape_index']}:")
+                        lines.append(f"  Shape {shape_result['shape_index']}:")
                         for error in shape_result.get("errors", []):
-                            print(f"    - {error}")
+                            lines.append(f"    - {error}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Below this many slides, process start-up and re-parsing cost more than they save
+_PARALLEL_MIN_SLIDES = 8
+
+# Per-process validator used by the validate_all worker pool
+_worker_validator: Optional[PPTValidator] = None
+
+
+def _init_slide_worker(manual_ppt_path: str, generated_ppt_path: str, fast_fail: bool):
+    """Open both presentations once per worker process."""
+    global _worker_validator
+    _worker_validator = PPTValidator(manual_ppt_path, generated_ppt_path, fast_fail=fast_fail)
+
+
+def _validate_slide_worker(slide_index: int) -> SlideResult:
+    """Validate one slide in a worker process (picklable entry point)."""
+    return _worker_validator.validate_slide(slide_index)
 
 
 def validate_ppt(manual_ppt_path: str, generated_ppt_path: str, 
-                output_report: Optional[str] = None) -> Dict[str, Any]:
+                output_report: Optional[str] = None,
+                fast_fail: bool = False) -> Dict[str, Any]:
     """
     Convenience function to validate a generated PPT against a manual version.
     
@@ -330,11 +557,12 @@ def validate_ppt(manual_ppt_path: str, generated_ppt_path: str,
         manual_ppt_path: Path to manually created PowerPoint file
         generated_ppt_path: Path to generated PowerPoint file
         output_report: Optional path to save validation report
+        fast_fail: Stop at the first structural mismatch per slide/table
     
     Returns:
         Dictionary containing validation results
     """
-    validator = PPTValidator(manual_ppt_path, generated_ppt_path)
+    validator = PPTValidator(manual_ppt_path, generated_ppt_path, fast_fail=fast_fail)
     results = validator.validate_all()
     
     validator.print_summary()
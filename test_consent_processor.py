@@ -3,6 +3,7 @@ Test Consent Processor
 Test the consent file processor and compare output with Working File
 """
 
+import numpy as np
 import pandas as pd
 from src.raw_file_processors import ConsentedStatusProcessor
 
@@ -45,10 +46,11 @@ if available_cols:
 print("\n\n🔍 COMPARISON:")
 print("-" * 80)
 if 'Division Name' in processed_df.columns and 'Division Name' in df_working.columns:
-    processed_divisions = set(processed_df['Division Name'].str.strip().str.lower())
-    working_divisions = set(df_working['Division Name'].str.strip().str.lower())
+    processed_divisions = np.sort(processed_df['Division Name'].dropna().str.strip().str.lower().unique())
+    working_divisions = np.sort(df_working['Division Name'].dropna().str.strip().str.lower().unique())
+    mismatched = np.setxor1d(processed_divisions, working_divisions, assume_unique=True)
     
-    print(f"Processed divisions: {sorted(processed_divisions)}")
-    print(f"Working file divisions: {sorted(working_divisions)}")
-    print(f"\nMatch: {processed_divisions == working_divisions}")
+    print(f"Processed divisions: {processed_divisions.tolist()}")
+    print(f"Working file divisions: {working_divisions.tolist()}")
+    print(f"\nMatch: {mismatched.size == 0}")
 
@@ -0,0 +1,47 @@
+"""
+Test Data Loader
+Check that sheet row counts agree with the rows load_excel returns
+"""
+
+import re
+import zipfile
+
+import openpyxl
+from openpyxl.styles import Font
+from src.data_loader import DataLoader
+
+
+def _save_workbook(path, data_rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['Division', 'Count'])
+    for i in range(data_rows):
+        ws.append([f'Div {i}', i])
+    # Formatted but empty trailing rows
+    for row in range(data_rows + 2, data_rows + 20):
+        ws.cell(row, 1).font = Font(bold=True)
+    wb.save(str(path))
+
+
+def _write_stale_dimension(path, stale_path):
+    with zipfile.ZipFile(str(path)) as zin, zipfile.ZipFile(str(stale_path), 'w') as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == 'xl/worksheets/sheet1.xml':
+                data = re.sub(rb'<dimension ref="[^"]*"/>', b'<dimension ref="A1"/>', data)
+            zout.writestr(item, data)
+
+
+def test_get_sheet_info_ignores_stale_dimension(tmp_path):
+    path = tmp_path / 'fresh.xlsx'
+    stale_path = tmp_path / 'stale.xlsx'
+    _save_workbook(path, 50)
+    _write_stale_dimension(path, stale_path)
+    loader = DataLoader()
+
+    for excel_path in (path, stale_path):
+        sheets = loader.get_sheet_info(str(excel_path))
+        data = loader.load_excel(str(excel_path))
+
+        assert sheets == [{'name': 'Sheet', 'row_count': 50}]
+        assert len(data['Sheet']) == 50
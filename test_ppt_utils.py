@@ -0,0 +1,84 @@
+"""
+Test PPT Utilities
+Check that the XML text readers match python-pptx's own text properties
+"""
+
+import json
+
+from pptx import Presentation
+from pptx.util import Inches
+from src.ppt_utils import extract_first_table, table_cell_texts, text_body_text
+from src.validator import PPTValidator, validate_ppt
+
+
+CELL_TEXTS = [
+    ["A\vB", "plain", ""],
+    ["first line\nsecond line", "x\v\vy", "line\vbreak\nnew para"],
+]
+
+
+def _build_table_slide():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shape = slide.shapes.add_table(2, 3, Inches(1), Inches(1), Inches(6), Inches(2))
+    for r, row in enumerate(CELL_TEXTS):
+        for c, text in enumerate(row):
+            shape.table.cell(r, c).text = text
+    return slide, shape.table
+
+
+def test_table_cell_texts_match_cell_text():
+    _, table = _build_table_slide()
+
+    expected = [[cell.text for cell in row.cells] for row in table.rows]
+
+    assert table_cell_texts(table._tbl) == expected
+    assert expected[0][0] == "A\vB"
+
+
+def test_extract_first_table_keeps_line_breaks():
+    slide, table = _build_table_slide()
+
+    assert extract_first_table(slide) == [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def _save_text_box_deck(path, text):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = text
+    prs.save(str(path))
+
+
+def test_text_body_text_matches_text_frame_text():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame
+    text_frame.text = "Hello\vWorld\nsecond\v\vparagraph"
+
+    assert text_body_text(text_frame._txBody) == text_frame.text
+
+
+def test_validate_shape_does_not_drop_line_breaks(tmp_path):
+    manual_path = tmp_path / "manual.pptx"
+    generated_path = tmp_path / "generated.pptx"
+    _save_text_box_deck(manual_path, "Hello\vWorld")
+    _save_text_box_deck(generated_path, "HelloWorld")
+
+    validator = PPTValidator(str(manual_path), str(generated_path))
+    manual_shape = validator.manual_prs.slides[0].shapes[0]
+    generated_shape = validator.generated_prs.slides[0].shapes[0]
+
+    assert not validator.validate_shape(manual_shape, generated_shape, 0).text_match
+    assert validator.validate_shape(manual_shape, manual_shape, 0).text_match
+
+
+def test_validate_ppt_returns_plain_dicts(tmp_path):
+    manual_path = tmp_path / "manual.pptx"
+    generated_path = tmp_path / "generated.pptx"
+    _save_text_box_deck(manual_path, "Hello")
+    _save_text_box_deck(generated_path, "Goodbye")
+
+    results = validate_ppt(str(manual_path), str(generated_path))
+
+    json.dumps(results)
+    assert results["slides"][0]["shapes"][0]["text_match"] is False
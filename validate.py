@@ -0,0 +1,279 @@
+"""
+Validate Generated Slides vs Manual PPT
+Compares the tables of selected slides (default: Slide 4 (Consent) and
+Slide 9 (Chronic & Overcalling)), opening each presentation only once.
+Each default slide is checked against its own generated test deck unless
+--generated is given.
+
+Usage:
+    python validate.py [--manual PATH] [--generated PATH] [--slide N ...]
+"""
+
+import argparse
+import sys
+from pptx import Presentation
+import numpy as np
+import pandas as pd
+from src.ppt_utils import extract_first_table
+
+
+DEFAULT_MANUAL_PPT = "Data/Apr 2025/AIL LT - April'25.pptx"
+
+# Generated test deck for each slide validated by default
+DEFAULT_GENERATED_PPTS = {
+    4: "output/test_slide4_raw.pptx",
+    9: "output/test_slide9_raw.pptx"
+}
+
+# Display names for the slides validated by default
+SLIDE_NAMES = {
+    4: "Slide 4 (Consent)",
+    9: "Slide 9 (Chronic & Overcalling)"
+}
+
+# Slides whose generated table also gets the standalone structure check
+STRUCTURE_CHECK_SLIDES = {4}
+
+
+def extract_table_data(slide, slide_num):
+    """Extract table data from a slide."""
+    data = extract_first_table(slide)
+    
+    if not data:
+        return None
+    
+    return [[text.strip() for text in row] for row in data]
+
+
+def flush_lines(lines):
+    """Write buffered report lines to stdout with a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def compare_tables(manual_data, generated_data, slide_name):
+    """Compare two tables and report differences."""
+    # Report lines are buffered and written with one flush_lines() call
+    lines = [
+        f"\n{'=' * 80}",
+        f"VALIDATING {slide_name}",
+        f"{'=' * 80}"
+    ]
+    
+    if not manual_data:
+        lines.append(f"✗ Manual PPT: No table found")
+        flush_lines(lines)
+        return False
+    
+    if not generated_data:
+        lines.append(f"✗ Generated PPT: No table found")
+        flush_lines(lines)
+        return False
+    
+    lines.append(f"\nManual PPT Table: {len(manual_data)} rows, {len(manual_data[0]) if manual_data else 0} cols")
+    lines.append(f"Generated PPT Table: {len(generated_data)} rows, {len(generated_data[0]) if generated_data else 0} cols")
+    
+    # Compare header rows
+    if len(manual_data) > 0 and len(generated_data) > 0:
+        manual_header = manual_data[0]
+        generated_header = generated_data[0]
+        
+        lines.append(f"\nManual Header: {manual_header}")
+        lines.append(f"Generated Header: {generated_header}")
+        
+        # Compare data rows
+        min_rows = min(len(manual_data), len(generated_data))
+        matches = 0
+        mismatches = []
+        
+        lines.append(f"\n{'=' * 80}")
+        lines.append("ROW-BY-ROW COMPARISON")
+        lines.append(f"{'=' * 80}")
+        
+        # Compare first few columns (division name and key metrics) of every
+        # data row at once: parse numbers where possible (allowing for formatting
+        # differences), fall back to case-insensitive string comparison
+        compare_width = 4
+        manual_rows = manual_data[1:min_rows]  # Skip header row
+        generated_rows = generated_data[1:min_rows]
+        compare_cols = np.array([
+            min(len(m_row), len(g_row), compare_width)
+            for m_row, g_row in zip(manual_rows, generated_rows)
+        ], dtype=int)
+        row_matches = np.zeros(len(manual_rows), dtype=bool)
+        
+        if len(manual_rows) > 0:
+            pad = [''] * compare_width
+            m_arr = np.array([[str(v).strip() for v in (row[:compare_width] + pad)[:compare_width]]
+                              for row in manual_rows], dtype=str)
+            g_arr = np.array([[str(v).strip() for v in (row[:compare_width] + pad)[:compare_width]]
+                              for row in generated_rows], dtype=str)
+            
+            m_clean = np.char.replace(np.char.replace(m_arr, ',', ''), '%', '')
+            g_clean = np.char.replace(np.char.replace(np.char.replace(g_arr, ',', ''), '%', ''), '.0', '')
+            m_num = pd.to_numeric(m_clean.ravel(), errors='coerce').astype(float).reshape(m_arr.shape)
+            g_num = pd.to_numeric(g_clean.ravel(), errors='coerce').astype(float).reshape(g_arr.shape)
+            
+            numeric = ~(np.isnan(m_num) | np.isnan(g_num))
+            with np.errstate(invalid='ignore'):
+                number_match = ~(np.abs(m_num - g_num) > 0.01)  # Allow small differences
+            string_match = np.char.lower(m_arr) == np.char.lower(g_arr)
+            cell_match = np.where(numeric, number_match, string_match)
+            
+            in_range = np.arange(compare_width) < compare_cols[:, None]
+            row_matches = (cell_match | ~in_range).all(axis=1)
+        
+        for i in range(1, min_rows):
+            compare_count = compare_cols[i - 1]
+            
+            if compare_count > 0:
+                manual_vals = manual_data[i][:compare_count]
+                generated_vals = generated_data[i][:compare_count]
+                match = bool(row_matches[i - 1])
+                
+                if match:
+                    matches += 1
+                    lines.append(f"✓ Row {i}: MATCH")
+                    lines.append(f"    Manual:   {manual_vals}")
+                    lines.append(f"    Generated: {generated_vals}")
+                else:
+                    mismatches.append(i)
+                    lines.append(f"✗ Row {i}: MISMATCH")
+                    lines.append(f"    Manual:   {manual_vals}")
+                    lines.append(f"    Generated: {generated_vals}")
+        
+        lines.append(f"\n{'=' * 80}")
+        lines.append("VALIDATION SUMMARY")
+        lines.append(f"{'=' * 80}")
+        lines.append(f"Total rows compared: {min_rows - 1}")
+        lines.append(f"Matches: {matches}")
+        lines.append(f"Mismatches: {len(mismatches)}")
+        
+        if len(mismatches) > 0:
+            lines.append(f"\nMismatched rows: {mismatches}")
+        
+        accuracy = (matches / (min_rows - 1) * 100) if (min_rows - 1) > 0 else 0
+        lines.append(f"\nAccuracy: {accuracy:.1f}%")
+        
+        if accuracy >= 80:
+            lines.append(f"✓ VALIDATION PASSED: {slide_name} is mostly correct!")
+        elif accuracy >= 50:
+            lines.append(f"⚠ VALIDATION PARTIAL: {slide_name} has some issues")
+        else:
+            lines.append(f"✗ VALIDATION FAILED: {slide_name} needs fixes")
+        
+        flush_lines(lines)
+        return accuracy >= 80
+
+
+def check_table_structure(generated_data, slide_name):
+    """Check that a generated table has at least 4 columns and a data row."""
+    lines = [
+        f"\n{'=' * 80}",
+        f"CHECKING {slide_name} STRUCTURE",
+        f"{'=' * 80}"
+    ]
+    
+    generated_rows = len(generated_data) if generated_data else 0
+    generated_cols = len(generated_data[0]) if generated_data else 0
+    lines.append(f"\nGenerated PPT Table: {generated_rows} rows, {generated_cols} cols")
+    
+    if generated_rows > 0 and generated_cols >= 4:
+        lines.append("✓ Table exists with correct structure")
+        lines.append(f"Generated header: {generated_data[0][:4]}")
+        
+        if generated_rows > 1:
+            lines.append(f"✓ Table has {generated_rows} rows (including header)")
+            lines.append(f"✓ First data row: {generated_data[1][:4]}")
+            lines.append(f"\n✓ VALIDATION PASSED: {slide_name} has data!")
+            flush_lines(lines)
+            return True
+        
+        lines.append("\n✗ VALIDATION FAILED: Table has no data rows")
+    else:
+        lines.append("✗ VALIDATION FAILED: Table structure incorrect")
+    
+    flush_lines(lines)
+    return False
+
+
+def validate_slide(manual_prs, generated_prs, slide_num):
+    """
+    Compare the first table of one slide (1-based) in both presentations.
+    
+    Returns:
+        Dict of check label -> passed (the table comparison, plus the
+        structure check for slides in STRUCTURE_CHECK_SLIDES)
+    """
+    slide_name = SLIDE_NAMES.get(slide_num, f"Slide {slide_num}")
+    structure_label = f"{slide_name} structure"
+    slide_idx = slide_num - 1
+    
+    if len(manual_prs.slides) <= slide_idx or len(generated_prs.slides) <= slide_idx:
+        print(f"\n✗ Slide {slide_num} not found in one or both presentations")
+        results = {slide_name: False}
+        if slide_num in STRUCTURE_CHECK_SLIDES:
+            results[structure_label] = False
+        return results
+    
+    manual_data = extract_table_data(manual_prs.slides[slide_idx], slide_num)
+    generated_data = extract_table_data(generated_prs.slides[slide_idx], slide_num)
+    
+    results = {slide_name: compare_tables(manual_data, generated_data, slide_name.upper())}
+    if slide_num in STRUCTURE_CHECK_SLIDES:
+        results[structure_label] = check_table_structure(generated_data, slide_name.upper())
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate generated slides against the manual PPT")
+    parser.add_argument("--manual", default=DEFAULT_MANUAL_PPT, help="Path to the manual PPT")
+    parser.add_argument("--generated", help="Path to the generated PPT "
+                        "(default: each slide's own test deck, see DEFAULT_GENERATED_PPTS)")
+    parser.add_argument("--slide", type=int, action="append", dest="slides",
+                        help="Slide number to validate (repeatable, default: 4 and 9)")
+    args = parser.parse_args()
+    slides = args.slides or sorted(SLIDE_NAMES)
+    
+    if args.generated:
+        generated_paths = {slide_num: args.generated for slide_num in slides}
+    else:
+        missing = [slide_num for slide_num in slides if slide_num not in DEFAULT_GENERATED_PPTS]
+        if missing:
+            parser.error(f"--generated is required for slide(s) {missing}")
+        generated_paths = {slide_num: DEFAULT_GENERATED_PPTS[slide_num] for slide_num in slides}
+    
+    print("=" * 80)
+    print("VALIDATING GENERATED SLIDES")
+    print("=" * 80)
+    
+    # Load presentations (once each, shared by every slide check that uses them)
+    manual_prs = Presentation(args.manual)
+    generated_decks = {path: Presentation(path) for path in dict.fromkeys(generated_paths.values())}
+    
+    print(f"\nManual PPT: {len(manual_prs.slides)} slides")
+    for path, generated_prs in generated_decks.items():
+        print(f"Generated PPT ({path}): {len(generated_prs.slides)} slides")
+    
+    results = {}
+    for slide_num in slides:
+        results.update(validate_slide(manual_prs, generated_decks[generated_paths[slide_num]], slide_num))
+    
+    # Overall summary
+    print(f"\n{'=' * 80}")
+    print("OVERALL VALIDATION SUMMARY")
+    print(f"{'=' * 80}")
+    for label, valid in results.items():
+        print(f"{label}: {'✓ PASS' if valid else '✗ FAIL'}")
+    
+    if all(results.values()):
+        print("\n🎉 ALL VALIDATIONS PASSED!")
+    elif any(results.values()):
+        print("\n⚠ PARTIAL SUCCESS - Some slides need fixes")
+    else:
+        print("\n✗ VALIDATION FAILED - Slides need fixes")
+    
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
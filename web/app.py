@@ -3,11 +3,19 @@ Flask Backend API for PPT Automation Web Interface
 """
 import os
 import sys
+import hashlib
 import json
+import logging
+import re
 import uuid
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file, render_template
+from flask import Flask, Request, current_app, request, jsonify, send_file, render_template
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import orjson
 from werkzeug.utils import secure_filename
 import pandas as pd
 
@@ -23,15 +31,123 @@ from src.ppt_generator import PPTGenerator
 sys.path.insert(0, os.path.dirname(__file__))
 from config_builder import ConfigBuilder
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson.
+    
+    orjson serializes NumPy scalars/arrays natively and writes NaN/inf as null,
+    so DataFrame records can be returned without pre-scrubbing.
+    """
+    
+    @staticmethod
+    def default(o):
+        """Handle types orjson doesn't serialize natively."""
+        # Missing-value sentinels become null like NaN does
+        if o is pd.NaT or o is pd.NA:
+            return None
+        return DefaultJSONProvider.default(o)
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class UploadRequest(Request):
+    """
+    Request that spools multipart file parts straight into the upload folder.
+    
+    Werkzeug's default keeps uploads in a SpooledTemporaryFile under the system
+    temp dir, so saving them meant a second full copy. Writing the part to a
+    temp file next to its final location lets the endpoint simply rename it.
+    Every part created is recorded in _spooled_parts, so parts of truncated
+    or rejected bodies that never reach request.files can still be removed.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._spooled_parts = []
+    
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        part = tempfile.NamedTemporaryFile(
+            'wb+', dir=current_app.config['UPLOAD_FOLDER'], suffix='.part', delete=False
+        )
+        self._spooled_parts.append(part)
+        return part
+
+
+def move_upload(file, file_path):
+    """
+    Move an uploaded file part to its final path without copying its contents.
+    
+    Args:
+        file: FileStorage whose stream was created by UploadRequest
+        file_path: Destination path
+    """
+    file.stream.close()
+    os.replace(file.stream.name, file_path)
+
+
+def discard_uploads(req):
+    """
+    Remove the spooled parts of a request that were not moved into place.
+    
+    Args:
+        req: UploadRequest whose multipart body may have been parsed
+    """
+    for part in getattr(req, '_spooled_parts', ()):
+        part.close()
+        try:
+            os.remove(part.name)
+        except FileNotFoundError:
+            pass  # Moved into place by move_upload
+
+
 app = Flask(__name__)
+app.json = OrjsonJSONProvider(app)
+app.request_class = UploadRequest
 CORS(app)
 
+
+@app.teardown_request
+def discard_request_uploads(exc):
+    """Remove upload parts left behind by any request, even a failed parse."""
+    discard_uploads(request)
+
 # Configuration
 # Use absolute paths to ensure uploads work from any directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
 OUTPUT_FOLDER = os.path.join(BASE_DIR, 'output')
 ALLOWED_EXTENSIONS = {'xlsx', 'xlsb', 'xls'}
+FILE_ID_RE = re.compile(r'[0-9a-f]{32}_')  # Prefix of upload ids
+# Leading bytes per extension: OOXML/xlsb are zip containers, .xls is OLE2
+FILE_SIGNATURES = {
+    'xlsx': b'PK\x03\x04',
+    'xlsb': b'PK\x03\x04',
+    'xls': b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',
+}
+COLUMN_SAMPLE_ROWS = 100  # Rows read to infer column dtypes
+PREVIEW_ROWS = 5  # Rows included in analyze-excel sample data
+PREVIEW_MAX_COLUMNS = 50  # Leading columns included in sample data of wide sheets
+MAX_LOAD_WORKERS = 8  # Threads used to parse and normalize uploads
+# Slide keys whose data lookups can't be traced to specific sheets
+UNTRACKED_DATA_KEYS = ('content_mappings', 'title_data_source', 'subtitle_data_source',
+                       'items_data_source')
+
+# Stateless helpers shared by all requests
+LOADER = DataLoader()
+NORMALIZER = DataNormalizer()
+CONFIG_BUILDER = ConfigBuilder()
 
 # Ensure directories exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -42,11 +158,204 @@ app.config['OUTPUT_FOLDER'] = OUTPUT_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 
 
+@lru_cache(maxsize=16)
+def _load_excel(file_path, mtime):
+    """Parse an Excel file; cached per (path, modification time)."""
+    return LOADER.load_excel(file_path)
+
+
+def load_excel_cached(file_path):
+    """
+    Load an uploaded Excel file, parsing it only once across requests.
+    
+    The returned DataFrames are shared between requests and must not be modified.
+    """
+    return _load_excel(file_path, os.path.getmtime(file_path))
+
+
+def sheet_references(slides):
+    """
+    Collect the (data_source, sheet) pairs that slides read table/chart data from.
+    
+    Args:
+        slides: Slide configs built by ConfigBuilder
+        
+    Returns:
+        List of (data_source, sheet) tuples, or None when some slide reads data
+        in a way that can't be traced to specific sheets
+    """
+    refs = []
+    for slide in slides:
+        # These are resolved against the whole data dict by the generator
+        if any(key in slide for key in UNTRACKED_DATA_KEYS):
+            return None
+        
+        table_mapping = slide.get('table_mapping') or {}
+        if table_mapping:
+            refs.append((table_mapping.get('data_source'), table_mapping.get('sheet')))
+        
+        chart = slide.get('chart') or {}
+        if chart.get('enabled', False):
+            # Charts fall back to the table's source/sheet when unset
+            refs.append((chart.get('data_source') or table_mapping.get('data_source'),
+                         chart.get('sheet') or table_mapping.get('sheet')))
+    
+    if any(not data_source or not sheet for data_source, sheet in refs):
+        return None
+    return refs
+
+
+def resolve_key(mapping, key, index):
+    """Find key in mapping by exact match, then via its lowercase index."""
+    if key in mapping:
+        return key
+    return index.get(str(key).strip().lower())
+
+
+def load_and_normalize(load_tasks, sheet_refs=None):
+    """
+    Load and normalize uploaded files concurrently.
+    
+    Files are parsed in parallel, then every needed sheet is normalized as an
+    independent task on the same pool. When sheet_refs is given, sheets that
+    no slide references keep their loaded (unnormalized) frames.
+    
+    Args:
+        load_tasks: List of (file_key, file_path) tuples
+        sheet_refs: Optional (data_source, sheet) pairs from sheet_references();
+            None normalizes every sheet
+        
+    Returns:
+        Dict mapping file_key to a normalized DataFrame or dict of DataFrames
+    """
+    if not load_tasks:
+        return {}
+    
+    def normalize(df):
+        # Preserve column names for accurate matching with user selections
+        return NORMALIZER.normalize_data(df, preserve_names=True)
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(load_tasks))) as executor:
+        loaded = list(executor.map(load_excel_cached, [path for _, path in load_tasks]))
+        loaded_by_key = dict(zip((file_key for file_key, _ in load_tasks), loaded))
+        
+        needed = None
+        if sheet_refs is not None:
+            needed = set()
+            source_index = lowercase_index(loaded_by_key)
+            for data_source, sheet in sheet_refs:
+                source_key = resolve_key(loaded_by_key, str(data_source).strip(), source_index)
+                sheets = loaded_by_key.get(source_key)
+                sheet_key = None
+                if isinstance(sheets, dict):
+                    sheet_key = resolve_key(sheets, sheet, lowercase_index(sheets))
+                elif source_key is not None:
+                    continue  # Single DataFrames are always normalized
+                if sheet_key is None:
+                    # The generator falls back to fuzzy matching; keep everything
+                    needed = None
+                    break
+                needed.add((source_key, sheet_key))
+        
+        futures = {}
+        for file_key, loaded_data in loaded_by_key.items():
+            if isinstance(loaded_data, pd.DataFrame):
+                futures[file_key] = executor.submit(normalize, loaded_data)
+            elif isinstance(loaded_data, dict):
+                futures[file_key] = {
+                    sheet: executor.submit(normalize, df)
+                    if needed is None or (file_key, sheet) in needed else df
+                    for sheet, df in loaded_data.items()
+                }
+        
+        all_loaded_data = {}
+        for file_key, value in futures.items():
+            if isinstance(value, dict):
+                all_loaded_data[file_key] = {
+                    sheet: df.result() if isinstance(df, Future) else df
+                    for sheet, df in value.items()
+                }
+            else:
+                all_loaded_data[file_key] = value.result()
+    
+    return all_loaded_data
+
+
+def lowercase_index(keys):
+    """
+    Map stripped, lowercased keys to the original keys for case-insensitive lookup.
+    
+    The first key wins when several normalize to the same value.
+    """
+    index = {}
+    for key in keys:
+        index.setdefault(str(key).strip().lower(), key)
+    return index
+
+
+def find_upload(file_id):
+    """
+    Resolve the stored path of an uploaded file.
+    
+    The id is the stored file name itself (<uuid hex>_<secure filename>), so
+    the path is rebuilt from it and checked with a single stat.
+    
+    Args:
+        file_id: Upload id returned by analyze-excel
+        
+    Returns:
+        Path of the uploaded file, or None if the id is unknown or malformed
+    """
+    # Only ids in the form we issue are accepted, which also rules out path traversal
+    if not isinstance(file_id, str) or not FILE_ID_RE.match(file_id) \
+            or secure_filename(file_id) != file_id:
+        return None
+    
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], file_id)
+    return file_path if os.path.isfile(file_path) else None
+
+
+def column_dtypes(df):
+    """List a DataFrame's columns as {'name', 'dtype'} dicts for the frontend."""
+    return [{'name': col, 'dtype': str(dtype)} for col, dtype in df.dtypes.items()]
+
+
+def preview_sample(df):
+    """
+    Leading rows and columns of a sheet in split form.
+    
+    Column names are sent once ({'columns': [...], 'data': [[...], ...]})
+    rather than repeated per row; NaN/NaT/inf become null in the
+    orjson-backed response.
+    """
+    return df.iloc[:PREVIEW_ROWS, :PREVIEW_MAX_COLUMNS].to_dict(orient='split', index=False)
+
+
+def make_etag(*parts):
+    """Build an ETag value from the inputs a response depends on."""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+def not_modified(etag):
+    """Return an empty 304 response for a client that already holds etag."""
+    response = app.response_class(status=304)
+    response.set_etag(etag)
+    return response
+
+
 def allowed_file(filename):
     """Check if file extension is allowed."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def has_excel_signature(file):
+    """Check that an upload's leading bytes match its (allowed) extension."""
+    signature = FILE_SIGNATURES[file.filename.rsplit('.', 1)[1].lower()]
+    header = file.stream.read(len(signature))
+    file.stream.seek(0)
+    return header == signature
+
+
 @app.route('/')
 def index():
     """Serve the main frontend page."""
@@ -56,6 +365,13 @@ def index():
 @app.route('/api/analyze-excel', methods=['POST'])
 def analyze_excel():
     """Analyze uploaded Excel file structure."""
+    # Reject oversized uploads before the body is read
+    if request.content_length is None:
+        return jsonify({'error': 'Content-Length required'}), 411
+    if request.content_length > app.config['MAX_CONTENT_LENGTH']:
+        return jsonify({'error': 'File too large'}), 413
+    
+    # Parts that are not moved into place are removed by discard_request_uploads
     if 'file' not in request.files:
         return jsonify({'error': 'No file provided'}), 400
     
@@ -66,16 +382,19 @@ def analyze_excel():
     if not allowed_file(file.filename):
         return jsonify({'error': 'Invalid file type. Only Excel files (.xlsx, .xlsb, .xls) are allowed.'}), 400
     
+    if not has_excel_signature(file):
+        return jsonify({'error': 'File content does not match its Excel file type.'}), 400
+    
     try:
         # Save uploaded file
         filename = secure_filename(file.filename)
-        file_id = str(uuid.uuid4())
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{file_id}_{filename}")
-        file.save(file_path)
+        # The id doubles as the stored file name, so lookups need no listing
+        file_id = f"{uuid.uuid4().hex}_{filename}"
+        file_path = os.path.join(app.config['UPLOAD_FOLDER'], file_id)
+        move_upload(file, file_path)
         
         # Analyze Excel structure
-        loader = DataLoader()
-        data = loader.load_excel(file_path)
+        data = load_excel_cached(file_path)
         
         analysis = {
             'file_id': file_id,
@@ -83,27 +402,13 @@ def analyze_excel():
             'sheets': []
         }
         
-        def clean_dataframe_for_json(df):
-            """Replace NaN, NaT, and other non-JSON-serializable values."""
-            # Convert to dict first, then clean NaN values
-            records = df.to_dict(orient='records')
-            # Clean records: replace any NaN/NaT/inf values with None (which becomes null in JSON)
-            for record in records:
-                for key, value in record.items():
-                    # Check for NaN/NaT
-                    if pd.isna(value):
-                        record[key] = None
-                    # Check for inf/-inf
-                    elif isinstance(value, float) and (value == float('inf') or value == float('-inf')):
-                        record[key] = None
-            return records
-        
         if isinstance(data, pd.DataFrame):
             # Single sheet
-            sample_data = clean_dataframe_for_json(data.head(5))
+            sample_data = preview_sample(data)
             analysis['sheets'].append({
                 'name': 'Sheet1',
                 'columns': list(data.columns),
+                'columns_with_dtype': column_dtypes(data),
                 'row_count': len(data),
                 'sample_data': sample_data
             })
@@ -111,10 +416,11 @@ def analyze_excel():
             # Multiple sheets
             for sheet_name, df in data.items():
                 if isinstance(df, pd.DataFrame):
-                    sample_data = clean_dataframe_for_json(df.head(5))
+                    sample_data = preview_sample(df)
                     analysis['sheets'].append({
                         'name': sheet_name,
                         'columns': list(df.columns),
+                        'columns_with_dtype': column_dtypes(df),
                         'row_count': len(df),
                         'sample_data': sample_data
                     })
@@ -134,24 +440,12 @@ def get_excel_sheets():
     
     try:
         # Find the file
-        upload_dir = Path(app.config['UPLOAD_FOLDER'])
-        files = list(upload_dir.glob(f"{file_id}_*"))
-        if not files:
+        file_path = find_upload(file_id)
+        if not file_path:
             return jsonify({'error': 'File not found'}), 404
         
-        file_path = str(files[0])
-        
-        # Load and analyze
-        loader = DataLoader()
-        data = loader.load_excel(file_path)
-        
-        sheets = []
-        if isinstance(data, pd.DataFrame):
-            sheets.append({'name': 'Sheet1', 'row_count': len(data)})
-        elif isinstance(data, dict):
-            for sheet_name, df in data.items():
-                if isinstance(df, pd.DataFrame):
-                    sheets.append({'name': sheet_name, 'row_count': len(df)})
+        # Read sheet dimensions only; cell data isn't needed here
+        sheets = LOADER.get_sheet_info(file_path)
         
         return jsonify({'sheets': sheets})
     
@@ -170,29 +464,25 @@ def get_excel_columns():
     
     try:
         # Find the file
-        upload_dir = Path(app.config['UPLOAD_FOLDER'])
-        files = list(upload_dir.glob(f"{file_id}_*"))
-        if not files:
+        file_path = find_upload(file_id)
+        if not file_path:
             return jsonify({'error': 'File not found'}), 404
         
-        file_path = str(files[0])
+        # Columns only change when the upload is replaced
+        etag = make_etag(file_id, sheet_name, os.path.getmtime(file_path))
+        if request.if_none_match.contains(etag):
+            return not_modified(etag)
         
-        # Load specific sheet
-        loader = DataLoader()
-        data = loader.load_excel(file_path)
+        sheet_names = [sheet['name'] for sheet in LOADER.get_sheet_info(file_path)]
+        if sheet_name not in sheet_names:
+            return jsonify({'error': f'Sheet "{sheet_name}" not found'}), 404
         
-        if isinstance(data, pd.DataFrame):
-            df = data
-        elif isinstance(data, dict):
-            if sheet_name not in data:
-                return jsonify({'error': f'Sheet "{sheet_name}" not found'}), 404
-            df = data[sheet_name]
-        else:
-            return jsonify({'error': 'Invalid data structure'}), 500
+        # Header plus a row sample is enough to report names and dtypes
+        df = LOADER.load_sheet_sample(file_path, sheet_name, nrows=COLUMN_SAMPLE_ROWS)
         
-        columns = [{'name': col, 'dtype': str(df[col].dtype)} for col in df.columns]
-        
-        return jsonify({'columns': columns})
+        response = jsonify({'columns': column_dtypes(df)})
+        response.set_etag(etag)
+        return response
     
     except Exception as e:
         return jsonify({'error': f'Error getting columns: {str(e)}'}), 500
@@ -202,16 +492,23 @@ def get_excel_columns():
 def get_templates():
     """Get list of available PowerPoint templates."""
     templates_dir = Path('templates')
-    templates = []
+    template_files = sorted(templates_dir.glob('*.pptx')) if templates_dir.exists() else []
     
-    if templates_dir.exists():
-        for template_file in templates_dir.glob('*.pptx'):
-            templates.append({
-                'name': template_file.stem,
-                'path': str(template_file)
-            })
+    # The listing only changes when template files are added, removed or replaced
+    etag = make_etag(*((str(f), f.stat().st_mtime) for f in template_files))
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
     
-    return jsonify({'templates': templates})
+    templates = []
+    for template_file in template_files:
+        templates.append({
+            'name': template_file.stem,
+            'path': str(template_file)
+        })
+    
+    response = jsonify({'templates': templates})
+    response.set_etag(etag)
+    return response
 
 
 @app.route('/api/generate-ppt', methods=['POST'])
@@ -245,65 +542,50 @@ def generate_ppt():
             if not os.path.exists(template_path):
                 return jsonify({'error': f'Template file not found. Checked: Template/Template.pptx and {template_path}'}), 404
         
-        # Load all uploaded files
-        upload_dir = Path(app.config['UPLOAD_FOLDER'])
-        all_loaded_data = {}
+        # Resolve uploaded files; they are parsed in parallel below
+        load_tasks = []
         
         for file_id, file_info in uploaded_files_info.items():
             # Find the uploaded file
-            files = list(upload_dir.glob(f"{file_id}_*"))
-            if not files:
+            file_path = find_upload(file_id)
+            if not file_path:
                 continue  # Skip if file not found
             
-            file_path = str(files[0])
-            
-            # Load and process data
-            loader = DataLoader()
-            loaded_data = loader.load_excel(file_path)
-            
-            # Normalize data
-            normalizer = DataNormalizer()
             # Use file name without extension as key (normalize for matching)
             file_key = os.path.splitext(file_info['name'])[0].strip()
-            
-            print(f"DEBUG: Loading file '{file_info['name']}' with key '{file_key}'")
-            
-            if isinstance(loaded_data, pd.DataFrame):
-                # Preserve column names for accurate matching with user selections
-                normalized_df = normalizer.normalize_data(loaded_data, preserve_names=True)
-                all_loaded_data[file_key] = normalized_df
-                print(f"DEBUG: Loaded single DataFrame with {len(normalized_df)} rows, {len(normalized_df.columns)} columns")
-                print(f"DEBUG:   Columns: {list(normalized_df.columns)}")
-            elif isinstance(loaded_data, dict):
-                # Preserve column names for accurate matching with user selections
-                all_loaded_data[file_key] = {
-                    sheet: normalizer.normalize_data(df, preserve_names=True)
-                    for sheet, df in loaded_data.items()
-                }
-                print(f"DEBUG: Loaded multi-sheet file with sheets: {list(all_loaded_data[file_key].keys())}")
-                for sheet_name, df in all_loaded_data[file_key].items():
-                    print(f"DEBUG:   Sheet '{sheet_name}': {len(df)} rows, {len(df.columns)} columns")
-                    print(f"DEBUG:     Columns: {list(df.columns)}")
-        
-        # Debug: Print loaded data keys
-        print(f"DEBUG: All loaded data keys: {list(all_loaded_data.keys())}")
-        for key, value in all_loaded_data.items():
-            if isinstance(value, dict):
-                print(f"DEBUG:   '{key}': dict with sheets {list(value.keys())}")
-            else:
-                print(f"DEBUG:   '{key}': DataFrame with columns {list(value.columns)[:5] if hasattr(value, 'columns') else 'N/A'}")
+            logger.debug("Loading file '%s' with key '%s'", file_info['name'], file_key)
+            load_tasks.append((file_key, file_path))
         
         # Build configuration from frontend data
-        config_builder = ConfigBuilder()
-        slides_yaml = config_builder.build_slides_config(slides_config)
+        slides_yaml = CONFIG_BUILDER.build_slides_config(slides_config)
         
-        # Debug: Print slide configs
-        print(f"DEBUG: Generated {len(slides_yaml.get('slides', []))} slide configs")
+        logger.debug("Generated %d slide configs", len(slides_yaml.get('slides', [])))
+        
+        # Only sheets the slides read from need normalizing
+        all_loaded_data = load_and_normalize(
+            load_tasks, sheet_references(slides_yaml.get('slides', []))
+        )
+        
+        # Column listings are only built when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            for file_key, value in all_loaded_data.items():
+                if isinstance(value, pd.DataFrame):
+                    logger.debug("Loaded '%s' as single DataFrame with %d rows, columns: %s",
+                                 file_key, len(value), list(value.columns))
+                else:
+                    logger.debug("Loaded '%s' as multi-sheet file with sheets: %s", file_key, list(value.keys()))
+                    for sheet_name, df in value.items():
+                        logger.debug("  Sheet '%s': %d rows, columns: %s", sheet_name, len(df), list(df.columns))
         
         # Validate data availability for all slides
         validation_errors = []
         validation_warnings = []
         
+        # Case-insensitive lookup tables, built once for all slides
+        data_source_index = lowercase_index(all_loaded_data)
+        sheet_indexes = {}
+        column_indexes = {}
+        
         for i, slide_config in enumerate(slides_yaml.get('slides', [])):
             table_mapping = slide_config.get('table_mapping', {})
             if table_mapping:
@@ -311,100 +593,72 @@ def generate_ppt():
                 sheet_name = table_mapping.get('sheet')
                 columns = table_mapping.get('columns', [])
                 
-                print(f"DEBUG: Slide {i+1} - data_source: '{data_source}', sheet: '{sheet_name}', columns: {columns}")
+                logger.debug("Slide %d - data_source: '%s', sheet: '%s', columns: %s",
+                             i + 1, data_source, sheet_name, columns)
                 
                 # Validate data source exists
                 if data_source:
                     data_source_normalized = str(data_source).strip()
-                    found = False
                     
-                    # Try exact match
+                    # Try exact match, then case-insensitive match
                     if data_source_normalized in all_loaded_data:
-                        found = True
+                        source_key = data_source_normalized
                     else:
-                        # Try case-insensitive match
-                        data_source_lower = data_source_normalized.lower()
-                        for key in all_loaded_data.keys():
-                            if str(key).strip().lower() == data_source_lower:
-                                found = True
-                                break
+                        source_key = data_source_index.get(data_source_normalized.lower())
                     
-                    if not found:
+                    if source_key is None:
                         warning_msg = f"Slide {i+1}: Data source '{data_source}' not found. Available: {list(all_loaded_data.keys())[:3]}"
                         validation_warnings.append(warning_msg)
-                        print(f"WARNING: {warning_msg}")
+                        logger.warning(warning_msg)
                     
                     # Validate sheet if data source found
-                    if found and sheet_name:
-                        df_source = all_loaded_data.get(data_source_normalized)
-                        if df_source is None:
-                            # Try case-insensitive match
-                            for key in all_loaded_data.keys():
-                                if str(key).strip().lower() == data_source_normalized.lower():
-                                    df_source = all_loaded_data[key]
-                                    break
+                    if source_key is not None and sheet_name:
+                        df_source = all_loaded_data[source_key]
+                        df = None
                         
                         if isinstance(df_source, dict):
-                            sheet_found = False
-                            sheet_lower = str(sheet_name).lower().strip()
-                            for sheet_key in df_source.keys():
-                                if str(sheet_key).lower().strip() == sheet_lower:
-                                    sheet_found = True
-                                    break
+                            if source_key not in sheet_indexes:
+                                sheet_indexes[source_key] = lowercase_index(df_source)
+                            sheet_key = sheet_indexes[source_key].get(str(sheet_name).strip().lower())
                             
-                            if not sheet_found:
+                            if sheet_key is None:
                                 warning_msg = f"Slide {i+1}: Sheet '{sheet_name}' not found in '{data_source}'. Available: {list(df_source.keys())[:3]}"
                                 validation_warnings.append(warning_msg)
-                                print(f"WARNING: {warning_msg}")
+                                logger.warning(warning_msg)
+                            else:
+                                df = df_source[sheet_key]
+                        elif isinstance(df_source, pd.DataFrame):
+                            df = df_source
                         
                         # Validate columns if sheet found
-                        if columns and len(columns) > 0:
-                            df = None
-                            if isinstance(df_source, dict):
-                                for sheet_key in df_source.keys():
-                                    if str(sheet_key).lower().strip() == str(sheet_name).lower().strip():
-                                        df = df_source[sheet_key]
-                                        break
-                            elif isinstance(df_source, pd.DataFrame):
-                                df = df_source
+                        if columns and df is not None and hasattr(df, 'columns'):
+                            if id(df) not in column_indexes:
+                                column_indexes[id(df)] = lowercase_index(df.columns)
+                            column_index = column_indexes[id(df)]
+                            # Each distinct requested column is hashed once
+                            requested = {str(col).strip().lower(): col for col in columns}
+                            missing_cols = [
+                                col for norm, col in requested.items()
+                                if norm not in column_index
+                            ]
                             
-                            if df is not None and hasattr(df, 'columns'):
-                                missing_cols = []
-                                available_cols = [str(c) for c in df.columns]
-                                for col in columns:
-                                    col_str = str(col).strip()
-                                    if col_str not in available_cols:
-                                        # Try case-insensitive
-                                        found_col = False
-                                        for avail_col in available_cols:
-                                            if avail_col.lower().strip() == col_str.lower():
-                                                found_col = True
-                                                break
-                                        if not found_col:
-                                            missing_cols.append(col)
-                                
-                                if missing_cols:
-                                    warning_msg = f"Slide {i+1}: Columns {missing_cols} not found. Available: {available_cols[:5]}"
-                                    validation_warnings.append(warning_msg)
-                                    print(f"WARNING: {warning_msg}")
+                            if missing_cols:
+                                available_cols = [str(c) for c in df.columns[:5]]
+                                warning_msg = f"Slide {i+1}: Columns {missing_cols} not found. Available: {available_cols}"
+                                validation_warnings.append(warning_msg)
+                                logger.warning(warning_msg)
         
         # Log validation results
         if validation_warnings:
-            print(f"INFO: Validation completed with {len(validation_warnings)} warnings. Generation will proceed with fallbacks.")
+            logger.info("Validation completed with %d warnings. Generation will proceed with fallbacks.",
+                        len(validation_warnings))
         else:
-            print(f"INFO: All data sources validated successfully.")
-        
-        # Save temporary config
-        config_id = str(uuid.uuid4())
-        temp_config_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{config_id}_slides.yaml")
-        with open(temp_config_path, 'w') as f:
-            import yaml
-            yaml.dump(slides_yaml, f)
+            logger.info("All data sources validated successfully.")
         
-        # Generate PPT
+        # Generate PPT; the slides config is handed over in memory
         generator = PPTGenerator(
             template_path=template_path,
-            slides_config=temp_config_path,
+            slides_config=slides_yaml,
             affiliate=affiliate
         )
         
@@ -437,7 +691,11 @@ def download_ppt(output_id):
             output_path,
             as_attachment=True,
             download_name=f'generated_presentation_{output_id}.pptx',
-            mimetype='application/vnd.openxmlformats-officedocument.presentationml.presentation'
+            mimetype='application/vnd.openxmlformats-officedocument.presentationml.presentation',
+            # Range/If-None-Match support; the body is served via wsgi.file_wrapper
+            conditional=True,
+            etag=True,
+            last_modified=os.path.getmtime(output_path)
         )
     
     except Exception as e:
@@ -2,12 +2,86 @@
 Configuration Builder
 Converts frontend form data to YAML configuration format
 """
-from typing import List, Dict, Any
+import json
+import logging
+import os
+import sys
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional
+import yaml
+
+# libyaml-backed emitter/parser when available
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+__all__ = ['ConfigBuilder', 'TableMapping']
+
+logger = logging.getLogger(__name__)
+
+# Default/compared values, interned so emitted configs share one object each
+_TITLE_ONLY = sys.intern('Title Only')
+_CONTENT = sys.intern('content')
+_COLUMN = sys.intern('column')
+_TABLE = sys.intern('table')
+
+# Marks a field absent from the slide data (distinct from an explicit None)
+_MISSING = object()
+
+
+class TableMapping:
+    """Table mapping of a table slide."""
+    
+    __slots__ = ("data_source", "sheet", "header_row", "columns",
+                 "filters", "max_rows", "formatting")
+    
+    # Emitted only when set to a non-empty value
+    _OPTIONAL_FIELDS = ("filters", "max_rows", "formatting")
+    
+    def __init__(self, data_source: str, sheet: str, header_row: int = 0,
+                 columns: Optional[List[Any]] = None,
+                 filters: Optional[List[Any]] = None,
+                 max_rows: Optional[int] = None,
+                 formatting: Optional[Dict[str, Any]] = None):
+        self.data_source = data_source
+        self.sheet = sheet
+        self.header_row = header_row
+        self.columns = columns if columns is not None else []
+        self.filters = filters
+        self.max_rows = max_rows
+        self.formatting = formatting
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the slides config form."""
+        mapping = {
+            'data_source': self.data_source,
+            'sheet': self.sheet,
+            'header_row': self.header_row,
+            'columns': self.columns
+        }
+        for field in self._OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value:
+                mapping[field] = value
+        return mapping
+
+
+def _wrap_column(columns: Any) -> List[Any]:
+    """Wrap a single column value in a list, treating empty values as no columns."""
+    return [columns] if columns else []
 
 
 class ConfigBuilder:
     """Builds YAML configuration from frontend form data."""
     
+    # Coercions to a column list by input type; anything else goes through _wrap_column.
+    # Read-only, since the table is shared by every instance.
+    _COL_COERCE = MappingProxyType({
+        list: lambda columns: columns,
+        type(None): lambda columns: [],
+    })
+    
     def build_slides_config(self, slides_config: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Build slides.yaml structure from frontend configuration.
@@ -18,56 +92,138 @@ class ConfigBuilder:
         Returns:
             Dictionary ready to be saved as YAML
         """
-        return {
-            'slides': [
-                self._build_slide_config(slide) for slide in slides_config
-            ]
-        }
+        return {'slides': list(map(self._build_slide_config, slides_config))}
+    
+    def to_yaml(self, config: Dict[str, Any]) -> str:
+        """
+        Serialize a built configuration to YAML.
+        
+        Args:
+            config: Configuration from build_slides_config
+        
+        Returns:
+            YAML text, keys in build order
+        """
+        # A large width avoids line-folding work on long strings
+        return yaml.dump(config, Dumper=YamlDumper, default_flow_style=False,
+                         sort_keys=False, allow_unicode=True, width=10000)
+    
+    def dump_with_cache(self, config: Dict[str, Any], path: str):
+        """
+        Save a configuration as YAML plus a JSON sidecar (path + '.json').
+        
+        Args:
+            config: Configuration from build_slides_config
+            path: Destination YAML path
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_yaml(config))
+        self._write_json_cache(config, path + '.json')
+    
+    @classmethod
+    def load_with_cache(cls, path: str) -> Dict[str, Any]:
+        """
+        Load a YAML configuration, using its JSON sidecar when it is current.
+        
+        The sidecar is used when it is at least as new as the YAML file;
+        otherwise the YAML is parsed and the sidecar rewritten.
+        
+        Args:
+            path: YAML configuration path
+        
+        Returns:
+            Parsed configuration
+        """
+        cache_path = path + '.json'
+        try:
+            if os.stat(cache_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass  # Missing or unreadable sidecar; fall back to the YAML
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=YamlLoader)
+        cls._write_json_cache(config, cache_path)
+        return config
+    
+    @staticmethod
+    def _write_json_cache(config: Dict[str, Any], cache_path: str):
+        """Write the JSON sidecar, or drop it if JSON can't represent the config."""
+        try:
+            text = json.dumps(config, separators=(',', ':'), ensure_ascii=False)
+            # YAML-only types (dates, non-string keys) wouldn't survive the round trip
+            representable = json.loads(text) == config
+        except (TypeError, ValueError):
+            representable = False
+        
+        if representable:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        elif os.path.exists(cache_path):
+            os.remove(cache_path)
+    
+    @staticmethod
+    def _norm(value: Any) -> str:
+        """
+        Strip surrounding whitespace from a user-entered name.
+        
+        Internal whitespace is kept, since data sources must match file keys
+        that are only stripped. Clean strings are returned without copying.
+        """
+        if type(value) is not str:
+            value = str(value)
+        # str.strip() returns the same object when there is nothing to strip
+        return value.strip()
     
     def _build_slide_config(self, slide_data: Dict[str, Any]) -> Dict[str, Any]:
         """Build a single slide configuration."""
+        # Deliberately not memoized: hashing a slide (e.g. via canonical JSON)
+        # costs several times more than building its config from scratch.
+        # Each field is looked up once and reused below
+        get = slide_data.get
+        slide_type = get('slide_type', _MISSING)
+        
         config = {
-            'slide_number': slide_data.get('slide_number', 1),
-            'slide_type': slide_data.get('slide_type', 'content'),
-            'title': slide_data.get('title', ''),
-            'layout_name': slide_data.get('layout_name', 'Title Only')
+            'slide_number': get('slide_number', 1),
+            'slide_type': _CONTENT if slide_type is _MISSING else slide_type,
+            'title': get('title', ''),
+            'layout_name': get('layout_name', _TITLE_ONLY)
         }
         
-        # Add subtitle if present
-        if slide_data.get('subtitle'):
-            config['subtitle'] = slide_data['subtitle']
-        
-        # Add title formatting if present
-        if slide_data.get('title_formatting'):
-            config['title_formatting'] = slide_data['title_formatting']
-        
-        # Add subtitle formatting if present
-        if slide_data.get('subtitle_formatting'):
-            config['subtitle_formatting'] = slide_data['subtitle_formatting']
+        # Add subtitle and title/subtitle formatting if present, in one update
+        config.update(
+            (key, value) for key, value in (
+                ('subtitle', get('subtitle')),
+                ('title_formatting', get('title_formatting')),
+                ('subtitle_formatting', get('subtitle_formatting')),
+            ) if value
+        )
         
         # Build chart configuration if enabled
-        chart_config = slide_data.get('chart', {})
-        if chart_config and chart_config.get('enabled', False):
+        chart_config = get('chart')
+        if chart_config and chart_config.get('enabled'):
+            chart_get = chart_config.get
             config['chart'] = {
                 'enabled': True,
-                'type': chart_config.get('type', 'column'),
-                'title': chart_config.get('title', ''),
-                'x_column': chart_config.get('x_column', ''),
-                'y_columns': chart_config.get('y_columns', []),
-                'data_source': slide_data.get('data_source'),
-                'sheet': slide_data.get('sheet'),
-                'header_row': slide_data.get('header_row', 0)
+                'type': chart_get('type', _COLUMN),
+                'title': chart_get('title', ''),
+                'x_column': chart_get('x_column', ''),
+                'y_columns': chart_get('y_columns', []),
+                'data_source': get('data_source'),
+                'sheet': get('sheet'),
+                'header_row': get('header_row', 0)
             }
         
         # Build table mapping if slide type is table
-        if slide_data.get('slide_type') == 'table':
+        if slide_type == _TABLE:
             table_mapping = self._build_table_mapping(slide_data)
             if table_mapping:
                 config['table_mapping'] = table_mapping
         
         # Build content mappings for content slides
-        if slide_data.get('slide_type') == 'content':
-            content_mappings = slide_data.get('content_mappings', [])
+        if slide_type == _CONTENT:
+            content_mappings = get('content_mappings', [])
             if content_mappings:
                 config['content_mappings'] = content_mappings
         
@@ -75,46 +231,31 @@ class ConfigBuilder:
     
     def _build_table_mapping(self, slide_data: Dict[str, Any]) -> Dict[str, Any]:
         """Build table mapping configuration."""
+        get = slide_data.get
         # data_source is the file name (without extension) from frontend
-        data_source = slide_data.get('data_source')
-        sheet = slide_data.get('sheet')
-        columns = slide_data.get('columns', [])
+        data_source = get('data_source')
+        sheet = get('sheet')
+        columns = get('columns', [])
         
         # Ensure columns is a list
-        if columns is None:
-            columns = []
-        elif not isinstance(columns, list):
-            columns = [columns] if columns else []
+        columns = self._COL_COERCE.get(type(columns), _wrap_column)(columns)
         
         # Normalize data_source (strip whitespace)
         if data_source:
-            data_source = str(data_source).strip()
+            data_source = self._norm(data_source)
         
         if not data_source or not sheet:
             return None
         
-        mapping = {
-            'data_source': data_source,
-            'sheet': sheet,
-            'header_row': slide_data.get('header_row', 0),
-            'columns': columns
-        }
-        
-        print(f"DEBUG ConfigBuilder: Built mapping - data_source: '{data_source}', sheet: '{sheet}', columns: {columns} (type: {type(columns)}, len: {len(columns)})")
-        
-        # Add filters if present
-        filters = slide_data.get('filters', [])
-        if filters:
-            mapping['filters'] = filters
-        
-        # Add max_rows if specified
-        if slide_data.get('max_rows'):
-            mapping['max_rows'] = slide_data['max_rows']
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Built mapping - data_source: %r, sheet: %r, columns: %r (len: %d)",
+                         data_source, sheet, columns, len(columns))
         
-        # Add formatting if present
-        formatting = slide_data.get('formatting')
-        if formatting:
-            mapping['formatting'] = formatting
-        
-        return mapping
-
+        return TableMapping(
+            data_source, sheet,
+            header_row=get('header_row', 0),
+            columns=columns,
+            filters=get('filters'),
+            max_rows=get('max_rows'),
+            formatting=get('formatting')
+        ).to_dict()
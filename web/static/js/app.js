@@ -174,17 +174,21 @@ async function loadDataPreview(slideIndex) {
     if (!slide.file_id || !slide.sheet) return;
     
     try {
-        const response = await fetch(`${API_BASE}/api/excel-columns?file_id=${slide.file_id}&sheet=${encodeURIComponent(slide.sheet)}`);
-        const data = await response.json();
+        const data = await fetchSheetColumns(slide, slide.file_id, slide.sheet);
         
         // Get sample data from analysis
         const fileAnalysis = slide.file_analysis;
         const sheetInfo = fileAnalysis.sheets.find(s => s.name === slide.sheet);
         
         if (sheetInfo && sheetInfo.sample_data) {
+            // sample_data is split-oriented: zip column names onto each row.
+            // Samples of wide sheets only cover the leading columns.
+            const sample = sheetInfo.sample_data;
             slide.data_preview = {
-                columns: data.columns,
-                sample_rows: sheetInfo.sample_data.slice(0, 5)
+                columns: data.columns.slice(0, sample.columns.length),
+                sample_rows: sample.data.slice(0, 5).map(row =>
+                    Object.fromEntries(sample.columns.map((col, i) => [col, row[i]]))
+                )
             };
         }
         
@@ -363,13 +367,26 @@ async function updateSlideSheet(slideIndex, sheetName) {
     renderSlides();
 }
 
+// Get a sheet's columns, preferring those returned by analyze-excel
+async function fetchSheetColumns(slide, fileId, sheetName) {
+    const analysis = slide.file_analysis;
+    if (analysis && analysis.file_id === fileId) {
+        const sheetInfo = analysis.sheets.find(s => s.name === sheetName);
+        if (sheetInfo && sheetInfo.columns_with_dtype) {
+            return { columns: sheetInfo.columns_with_dtype };
+        }
+    }
+    
+    const response = await fetch(`${API_BASE}/api/excel-columns?file_id=${fileId}&sheet=${encodeURIComponent(sheetName)}`);
+    return response.json();
+}
+
 // Load Columns for a Sheet
 async function loadColumns(slideIndex, fileId, sheetName) {
     if (!fileId) return;
     
     try {
-        const response = await fetch(`${API_BASE}/api/excel-columns?file_id=${fileId}&sheet=${encodeURIComponent(sheetName)}`);
-        const data = await response.json();
+        const data = await fetchSheetColumns(slides[slideIndex], fileId, sheetName);
         
         const container = document.getElementById(`columns-${slideIndex}`);
         if (!container) return;